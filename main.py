@@ -1,43 +1,264 @@
+import atexit
+import glob
+import logging
+import operator
+import queue
 import sys
+import threading
 import time
-import odrive
-from odrive.enums import *
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener
+import numpy as np
+
+# Log records only get enqueued on the calling thread; a background listener
+# does the actual terminal I/O, so logging can never stall the GUI or the
+# poll loop the way a blocking print() can
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+_log_queue = queue.Queue(-1)
+logger.addHandler(QueueHandler(_log_queue))
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# The odrive package drags in fibre and libusb and takes the better part of
+# a second to import, so it is loaded lazily via _import_odrive below and
+# overlapped with UI construction. The enum values used by the GUI get
+# sensible defaults here and are re-bound from odrive.enums once imported.
+odrive = None
+AXIS_STATE_IDLE = 1
+AXIS_STATE_CLOSED_LOOP_CONTROL = 8
+CONTROL_MODE_POSITION_CONTROL = 3
+CONTROL_MODE_VELOCITY_CONTROL = 2
+ObjectLostError = OSError
+
 from PySide6.QtWidgets import (QApplication, QMainWindow, QPushButton, QVBoxLayout,
                                QWidget, QHBoxLayout, QLabel, QLineEdit, QGridLayout,
-                               QGroupBox, QComboBox, QSlider)
-from PySide6.QtCore import Qt, QThread, Signal, Slot
+                               QGroupBox, QComboBox, QSlider, QGraphicsItem)
+from PySide6.QtCore import Qt, QThread, QTimer, Signal, Slot
 import pyqtgraph as pg
 
+# Raster the curves on the GPU instead of re-tessellating QPainterPaths
+# on the CPU every frame; antialiasing is the main per-segment cost.
+# The GL backend needs PyOpenGL — fall back to the raster painter without it.
+try:
+    import OpenGL  # noqa: F401
+    _USE_OPENGL = True
+except ImportError:
+    _USE_OPENGL = False
+pg.setConfigOptions(useOpenGL=_USE_OPENGL, enableExperimental=_USE_OPENGL,
+                    antialias=False, background='w', foreground='k')
+
 # Matplotlib-inspired "Matte" colors
 MPL_BLUE = '#1f77b4'
 MPL_ORANGE = '#ff7f0e'
 MPL_GREEN = '#2ca02c'
 MPL_RED = '#d62728'
 
+# Curve pens built once; mkPen parses the color and allocates a QPen per call
+PEN_BLUE = pg.mkPen(MPL_BLUE, width=2)
+PEN_ORANGE = pg.mkPen(MPL_ORANGE, width=2)
+PEN_GREEN = pg.mkPen(MPL_GREEN, width=2)
+PEN_RED = pg.mkPen(MPL_RED, width=2)
+
+
+def m4_downsample(x, y, px_width):
+    """Reduce a trace to at most 4 points per pixel column (M4 aggregation).
+
+    Keeps the first, min, max and last sample of every column in time
+    order, which rasterizes pixel-identically to the full data set while
+    issuing far fewer line segments. Returns the inputs unchanged when the
+    data is already sparser than 4 points per column.
+    """
+    n = len(y)
+    if px_width <= 0 or n <= 4 * px_width:
+        return x, y
+    k = n // px_width  # samples per column
+    m = px_width * k
+    xb = x[:m].reshape(px_width, k)
+    yb = y[:m].reshape(px_width, k)
+    imin = np.argmin(yb, axis=1)
+    imax = np.argmax(yb, axis=1)
+    cols = np.arange(px_width)[:, None]
+    idx = np.stack((np.zeros(px_width, dtype=np.intp),
+                    np.minimum(imin, imax),
+                    np.maximum(imin, imax),
+                    np.full(px_width, k - 1, dtype=np.intp)), axis=1)
+    xs, ys = xb[cols, idx].ravel(), yb[cols, idx].ravel()
+    if m < n:  # Leftover samples that didn't fill a column
+        xs = np.concatenate((xs, x[m:]))
+        ys = np.concatenate((ys, y[m:]))
+    return xs, ys
+
+
+_import_lock = threading.Lock()
+
+
+def _import_odrive():
+    """Import the odrive stack and publish the enum constants the GUI uses.
+
+    Called from a warm-up thread while the window is being built and again
+    from the worker before its first connection attempt; both calls are
+    cheap once the import has happened.
+    """
+    global odrive, ObjectLostError
+    global AXIS_STATE_IDLE, AXIS_STATE_CLOSED_LOOP_CONTROL
+    global CONTROL_MODE_POSITION_CONTROL, CONTROL_MODE_VELOCITY_CONTROL
+    with _import_lock:
+        if odrive is not None:
+            return
+        import odrive as _odrive
+        from odrive import enums as _enums
+        AXIS_STATE_IDLE = _enums.AXIS_STATE_IDLE
+        AXIS_STATE_CLOSED_LOOP_CONTROL = _enums.AXIS_STATE_CLOSED_LOOP_CONTROL
+        CONTROL_MODE_POSITION_CONTROL = _enums.CONTROL_MODE_POSITION_CONTROL
+        CONTROL_MODE_VELOCITY_CONTROL = _enums.CONTROL_MODE_VELOCITY_CONTROL
+        try:
+            from fibre.libfibre import ObjectLostError as _object_lost
+            ObjectLostError = _object_lost
+        except ImportError:  # Older fibre releases predate libfibre
+            pass
+        odrive = _odrive
+
+
+ODRIVE_VID_PID = ("1209", "0d32")
+
+
+def lower_usb_latency():
+    """Best-effort: drop the kernel latency_timer for the ODrive to 1 ms.
+
+    Linux buffers usb-serial transfers for 16 ms by default, which caps the
+    achievable poll rate well below what the bus can do. Writing the sysfs
+    attribute needs root or a udev rule, so failures are silently ignored.
+    """
+    if not sys.platform.startswith("linux"):
+        return
+    for dev in glob.glob("/sys/bus/usb/devices/*"):
+        try:
+            with open(dev + "/idVendor") as f:
+                vid = f.read().strip()
+            with open(dev + "/idProduct") as f:
+                pid = f.read().strip()
+        except OSError:
+            continue
+        if (vid, pid) != ODRIVE_VID_PID:
+            continue
+        for timer in glob.glob(dev + "/**/latency_timer", recursive=True):
+            try:
+                with open(timer, "w") as f:
+                    f.write("1")
+                logger.info("Lowered USB latency_timer to 1 ms: %s", timer)
+            except OSError:
+                pass
+
+
+# Helper to reverse lookup enum names; the reverse map for each enum class
+# is built once and cached instead of scanning __dict__ on every call
+_ENUM_NAME_CACHE = {}
+
 
-# Helper to reverse lookup enum names
 def get_enum_name(enum_class, value):
-    for name, val in enum_class.__dict__.items():
-        if val == value:
-            return name
-    return str(value)
+    names = _ENUM_NAME_CACHE.get(enum_class)
+    if names is None:
+        names = {val: name for name, val in enum_class.__dict__.items()}
+        _ENUM_NAME_CACHE[enum_class] = names
+    return names.get(value, str(value))
+
+
+# Display names built once at import instead of per telemetry frame
+AXIS_STATE_NAMES = {0: "UNDEFINED", 1: "IDLE", 3: "MOTOR_CALIB",
+                    7: "ENC_CALIB", 8: "CLOSED_LOOP"}
+CTRL_MODE_NAMES = {1: "VOLTAGE", 2: "TORQUE", 3: "VELOCITY", 4: "POSITION"}
+
+# Telemetry sample layout shared between the worker and the GUI; a single
+# preallocated record replaces the per-tick dict of ten string keys
+TELEMETRY_DTYPE = np.dtype([('iq', 'f4'), ('vbus', 'f4'), ('pos', 'f4'),
+                            ('vel', 'f4'), ('shadow', 'i4'), ('error', 'u4'),
+                            ('enc_error', 'u4'), ('state', 'i4'),
+                            ('ctrl_mode', 'i4'), ('input_mode', 'i4')])
+
+# Whole-label templates bound once; a single format call builds each label
+# string instead of an f-string parse plus concatenation per frame
+_FMT_STATE = "State: {}".format
+_FMT_CTRL_MODE = "Ctrl Mode: {}".format
+_FMT_INP_MODE = "Inp Mode: {}".format
+_FMT_CURRENT = "Motor Current: {:.2f} A".format
+_FMT_POWER = "Power: {:.1f} W".format
+_FMT_VBUS = "VBus: {:.2f}V".format
+_FMT_SHADOW = "Shadow: {}".format
+_FMT_ERROR = "Error: {:#x}".format
+_FMT_POS = "Pos: {:.3f} Turns".format
+_FMT_VEL = "Vel: {:.3f} Turns/s".format
 
 
 class ODriveWorker(QThread):
-    data_received = Signal(dict)
+    data_received = Signal(object)
     connection_status = Signal(bool, str)
 
     def __init__(self):
         super().__init__()
         self.odrv = None
         self.running = True
+        self.period = 0.02  # Target poll interval in seconds
+        # Each attribute read is its own ~5 ms USB round-trip, so the
+        # rarely-changing config fields are only re-read once a second
+        self._cfg_cache = None
+        self._cfg_read_t = 0.0
+        # Two alternating telemetry records: the GUI slot reads the one just
+        # emitted while the next poll fills the other, so the reused storage
+        # is never mutated under the reader. Still zero allocation per sample.
+        self._recs = np.zeros(2, TELEMETRY_DTYPE)
+        self._rec_idx = 0
+        # Single-slot hand-off the GUI render timer pulls from; appending
+        # is lock-free and drops stale samples instead of queueing events
+        self.samples = deque(maxlen=1)
+        self._err_count = 0
+        self._reconnect_delay = 1.0
+        # Set by stop(); lets the reconnect backoff wake immediately so the
+        # thread can be joined without waiting out the delay
+        self._stop_event = threading.Event()
+        # Values we last wrote to the controller config, so repeated
+        # "Apply" clicks don't re-send unchanged fields over USB
+        self._last_cfg = {}
+        self._last_input = None
+        self._pending_tuning = None
+        # Fibre sub-objects resolved once per connection; every
+        # odrv.axis0.encoder.* chain otherwise re-dispatches through
+        # fibre's __getattr__ on each hop
+        self._axis = None
+        self._encoder = None
+        self._motor_cc = None
+        self._ctrl_cfg = None
+        self._getters = ()
 
     def run(self):
+        _import_odrive()
         while self.running:
             if self.odrv is None:
                 try:
                     self.connection_status.emit(False, "Searching...")
                     self.odrv = odrive.find_any(timeout=2)
+                    lower_usb_latency()
+                    self._last_cfg = {}
+                    self._last_input = None
+                    self._axis = self.odrv.axis0
+                    self._encoder = self._axis.encoder
+                    self._motor_cc = self._axis.motor.current_control
+                    self._ctrl_cfg = self._axis.controller.config
+                    # Record field -> (owner, precompiled getter); keeps the
+                    # poll loop down to one table walk per sample and the
+                    # field list next to TELEMETRY_DTYPE's layout
+                    ag = operator.attrgetter
+                    self._getters = (
+                        ('iq', self._motor_cc, ag('Iq_measured')),
+                        ('vbus', self.odrv, ag('vbus_voltage')),
+                        ('pos', self._encoder, ag('pos_estimate')),
+                        ('vel', self._encoder, ag('vel_estimate')),
+                        ('shadow', self._encoder, ag('shadow_count')),
+                        ('error', self._axis, ag('error')),
+                        ('enc_error', self._encoder, ag('error')),
+                        ('state', self._axis, ag('current_state')),
+                    )
 
                     # --- NEW: Fetch current config once on connection ---
                     init_cfg = {
@@ -50,51 +271,104 @@ class ODriveWorker(QThread):
                     # ----------------------------------------------------
 
                     self.connection_status.emit(True, "Connected")
+                    self._reconnect_delay = 1.0
                 except Exception as e:
-                    print(f"ODrive connection failed: {e}")
-                    time.sleep(1)
+                    logger.warning("ODrive connection failed: %s", e)
+                    # Back off exponentially so a missing device doesn't keep
+                    # the thread busy re-enumerating the USB bus; the wait
+                    # aborts early when stop() is called
+                    self._stop_event.wait(self._reconnect_delay)
+                    self._reconnect_delay = min(self._reconnect_delay * 2, 8.0)
                     continue
             try:
-                data = {
-                    "iq": self.odrv.axis0.motor.current_control.Iq_measured,
-                    "vbus": self.odrv.vbus_voltage,
-                    "pos": self.odrv.axis0.encoder.pos_estimate,
-                    "vel": self.odrv.axis0.encoder.vel_estimate,
-                    "shadow": self.odrv.axis0.encoder.shadow_count,
-                    "error": self.odrv.axis0.error,
-                    "enc_error": self.odrv.axis0.encoder.error,
-                    "state": self.odrv.axis0.current_state,
-                    "ctrl_mode": self.odrv.axis0.controller.config.control_mode,
-                    "input_mode": self.odrv.axis0.controller.config.input_mode,
-                }
-                self.data_received.emit(data)
-                time.sleep(0.05)
-            except:
+                t0 = time.perf_counter()
+
+                # Apply any queued tuning change here so the GUI thread
+                # never has to sleep while the config writes settle
+                pending = self._pending_tuning
+                if pending is not None:
+                    # Use the connection-scoped axis handle: self.odrv can be
+                    # nulled by reboot() on the GUI thread between the loop-top
+                    # check and here, and the resulting AttributeError would
+                    # kill the poll thread. Clear the request only once it has
+                    # fully applied so a transient USB error retries it instead
+                    # of silently dropping the closed-loop transition.
+                    self.update_tuning(*pending)
+                    self._axis.requested_state = AXIS_STATE_CLOSED_LOOP_CONTROL
+                    self._pending_tuning = None
+
+                now = time.monotonic()
+                if self._cfg_cache is None or now - self._cfg_read_t > 1.0:
+                    self._cfg_cache = (self._ctrl_cfg.control_mode,
+                                       self._ctrl_cfg.input_mode)
+                    self._cfg_read_t = now
+                rec = self._recs[self._rec_idx]
+                self._rec_idx ^= 1
+                for name, owner, get in self._getters:
+                    rec[name] = get(owner)
+                rec['ctrl_mode'] = self._cfg_cache[0]
+                rec['input_mode'] = self._cfg_cache[1]
+                self.samples.append(rec)
+                self._err_count = 0
+                # Sleep only for whatever is left of the period, so slow USB
+                # transactions don't stack on top of a fixed delay
+                time.sleep(max(0.0, self.period - (time.perf_counter() - t0)))
+            except (ObjectLostError, OSError) as e:
+                # Retry transient bus glitches before paying for a full
+                # find_any re-enumeration (multiple seconds)
+                self._err_count += 1
+                if self._err_count < 3:
+                    continue
+                logger.warning("ODrive link lost: %s", e)
+                self._err_count = 0
                 self.odrv = None
+                self._cfg_cache = None
                 self.connection_status.emit(False, "Disconnected")
 
+    def stop(self):
+        self.running = False
+        self._stop_event.set()
+
     def set_state(self, state_code):
         if self.odrv:
             self.odrv.axis0.requested_state = state_code
 
+    def request_tuning(self, pos_g, vel_g, vel_i_g, vel_lim, mode):
+        """Queue gains to be applied from the poll loop, followed by the
+        transition into closed-loop control."""
+        self._pending_tuning = (pos_g, vel_g, vel_i_g, vel_lim, mode)
+
     # Inside ODriveWorker class
     def update_tuning(self, pos_g, vel_g, vel_i_g, vel_lim, mode):  # Added vel_lim
         if self.odrv:
-            self.odrv.axis0.controller.config.control_mode = mode
-            self.odrv.axis0.controller.config.input_mode = 1
-
-            # Apply the limit here
-            self.odrv.axis0.controller.config.vel_limit = vel_lim
-
-            self.odrv.axis0.controller.config.pos_gain = pos_g
-            self.odrv.axis0.controller.config.vel_gain = vel_g
-            self.odrv.axis0.controller.config.vel_integrator_gain = vel_i_g
+            # Each config assignment is its own ~5 ms USB round-trip, so
+            # only write the fields that differ from what we last sent
+            config = self.odrv.axis0.controller.config
+            wanted = {
+                "control_mode": mode,
+                "input_mode": 1,
+                "vel_limit": vel_lim,
+                "pos_gain": pos_g,
+                "vel_gain": vel_g,
+                "vel_integrator_gain": vel_i_g,
+            }
+            for name, value in wanted.items():
+                if self._last_cfg.get(name) != value:
+                    setattr(config, name, value)
+                    self._last_cfg[name] = value
 
             self.odrv.axis0.controller.input_pos = self.odrv.axis0.encoder.pos_estimate
             self.odrv.axis0.controller.input_vel = 0
+            self._last_input = None
+            self._cfg_cache = None  # Re-read the modes on the next poll
 
     def set_input(self, value, is_pos_mode):
         if self.odrv:
+            # Slider drags deliver long runs of identical values; each write
+            # is a USB round-trip, so only send actual changes
+            if (value, is_pos_mode) == self._last_input:
+                return
+            self._last_input = (value, is_pos_mode)
             if is_pos_mode:
                 self.odrv.axis0.controller.input_pos = value
             else:
@@ -109,14 +383,15 @@ class ODriveWorker(QThread):
             self.odrv.axis0.motor.error = 0
             try:
                 self.odrv.clear_errors()
-            except:
+            except (ObjectLostError, OSError, AttributeError):
                 pass
 
     def reboot(self):
         if self.odrv:
             try:
                 self.odrv.reboot()
-            except:
+            except (ObjectLostError, OSError):
+                # The device drops off the bus mid-call when rebooting
                 pass
             self.odrv = None
 
@@ -129,12 +404,42 @@ class MainWindow(QMainWindow):
         self.setStyleSheet("QMainWindow { background-color: #f5f5f5; } QGroupBox { font-weight: bold; }")
 
         self.max_points = 200
-        self.vbus_data, self.pos_data, self.vel_data, self.iq_data = [], [], [], [] # Added iq_data
+        # Preallocated doubled circular history (rows: iq, vbus, pos, vel).
+        # Each sample is written twice, max_points apart, so the newest window
+        # is always a single contiguous zero-copy slice — no roll/concatenate.
+        # Channel-major layout keeps each channel's window contiguous too.
+        self._hist = np.zeros((4, 2 * self.max_points), dtype=np.float32)
+        self._head = 0
+        self._filled = 0
+        self._x_axis = np.arange(self.max_points, dtype=np.float32)
         self.current_axis_state = 0  # Default to undefined
+        self._last_button_state = None
+        self._y_adapt_count = 0
+        self._label_phase = 0
+
+        # Start pulling in the odrive stack while the widgets are built
+        threading.Thread(target=_import_odrive, daemon=True).start()
 
         self.worker = ODriveWorker()
         self._setup_ui()
 
+        # Render timer: the data slot only fills the ring buffer, and this
+        # timer repaints at most once per frame. Caps the repaint rate
+        # independently of the telemetry sample rate; update_status starts
+        # it on connect and stops it while searching for a device.
+        self._latest = None
+        self._dirty = False
+        self._render_timer = QTimer(self)
+        self._render_timer.timeout.connect(self._flush)
+
+        # Coalesce bursts of setpoint events (slider drags fire per pixel
+        # step) into one USB write carrying only the newest value
+        self._pending_target = None
+        self._target_timer = QTimer(self)
+        self._target_timer.setSingleShot(True)
+        self._target_timer.setInterval(16)
+        self._target_timer.timeout.connect(self._send_pending_target)
+
         self.worker.data_received.connect(self.update_telemetry)
         self.worker.connection_status.connect(self.update_status)
         self.worker.start()
@@ -289,19 +594,35 @@ class MainWindow(QMainWindow):
 
         # --- RIGHT PANEL ---
         right_panel = QVBoxLayout()
-        self.vbus_plot = pg.PlotWidget(title="Bus Voltage")
-        self.iq_plot = pg.PlotWidget(title="IQ Current")  # Added IQ plot
-        self.motion_plot = pg.PlotWidget(title="Motion Telemetry")
+        # One GraphicsLayoutWidget = one shared scene and viewport, so each
+        # frame triggers a single paint event instead of three
+        self.plots = pg.GraphicsLayoutWidget()
+        self.vbus_plot = self.plots.addPlot(row=0, col=0, title="Bus Voltage")
+        self.iq_plot = self.plots.addPlot(row=1, col=0, title="IQ Current")  # Added IQ plot
+        self.motion_plot = self.plots.addPlot(row=2, col=0, title="Motion Telemetry")
+        self.plots.ci.layout.setRowStretchFactor(2, 2)  # Motion plot gets double height
         self._style_plot(self.vbus_plot, "V", "V")
         self._style_plot(self.motion_plot, "Value", "Turns")
         self._style_plot(self.iq_plot, "A", "A")
-        self.vbus_curve = self.vbus_plot.plot(pen=pg.mkPen(MPL_BLUE, width=2))
-
-        self.iq_curve = self.iq_plot.plot(pen=pg.mkPen(MPL_RED, width=2))  # Added IQ curve
-        self.power_curve = self.iq_plot.plot(pen=pg.mkPen(MPL_ORANGE, width=2))  # Added Power curve (scaled IQ for visualization)
-
-        self.pos_curve = self.motion_plot.plot(pen=pg.mkPen(MPL_ORANGE, width=2), name="Position")
-        self.vel_curve = self.motion_plot.plot(pen=pg.mkPen(MPL_GREEN, width=2), name="Velocity")
+        # Bare PlotCurveItems skip the finite/NaN scanning and connect-array
+        # bookkeeping a PlotDataItem wrapper re-does on every setData
+        self.vbus_curve = pg.PlotCurveItem(pen=PEN_BLUE, skipFiniteCheck=True)
+        self.vbus_plot.addItem(self.vbus_curve)
+
+        self.iq_curve = pg.PlotCurveItem(pen=PEN_RED, skipFiniteCheck=True)  # Added IQ curve
+        self.iq_plot.addItem(self.iq_curve)
+        self.power_curve = self.iq_plot.plot(pen=PEN_ORANGE)  # Added Power curve (scaled IQ for visualization)
+
+        self.pos_curve = pg.PlotCurveItem(pen=PEN_ORANGE, skipFiniteCheck=True, name="Position")
+        self.motion_plot.addItem(self.pos_curve)
+        self.vel_curve = pg.PlotCurveItem(pen=PEN_GREEN, skipFiniteCheck=True, name="Velocity")
+        self.motion_plot.addItem(self.vel_curve)
+
+        # (curve, plot, history row) walked on every flush; built once here
+        self._curve_table = ((self.iq_curve, self.iq_plot, 0),
+                             (self.vbus_curve, self.vbus_plot, 1),
+                             (self.pos_curve, self.motion_plot, 2),
+                             (self.vel_curve, self.motion_plot, 3))
 
         readout_layout = QHBoxLayout()
         readout_style = "font-size: 16pt; font-weight: bold; padding: 10px; border: 1px solid #ccc; border-radius: 8px; background: white;"
@@ -312,17 +633,27 @@ class MainWindow(QMainWindow):
         readout_layout.addWidget(self.label_live_pos)
         readout_layout.addWidget(self.label_live_vel)
 
-        right_panel.addWidget(self.vbus_plot, 1)
-        right_panel.addWidget(self.iq_plot, 1)  # Added IQ plot to right panel
-        right_panel.addWidget(self.motion_plot, 2)
+        right_panel.addWidget(self.plots, 4)
         right_panel.addLayout(readout_layout)
         main_layout.addLayout(right_panel, 3)
 
     def _style_plot(self, plot, y_name, unit):
-        plot.setBackground('w')
         plot.showGrid(x=True, y=True, alpha=0.3)
         plot.setLabel('left', y_name, units=unit)
         plot.addLegend(offset=(10, 10))
+        plot.setDownsampling(mode='peak')
+        plot.setClipToView(True)
+        # Ranges are managed by _flush; letting the ViewBox autorange would
+        # re-scan every curve on every repaint
+        plot.setMouseEnabled(x=False, y=False)
+        plot.enableAutoRange('xy', False)
+        plot.setXRange(0, self.max_points, padding=0)
+        # Pixel-buffer the static furniture so Qt doesn't re-rasterize it
+        # every frame; the curves change per frame and must not be cached
+        for item in (plot.getAxis('left'), plot.getAxis('bottom'),
+                     plot.titleLabel, plot.legend):
+            if item is not None:
+                item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
 
     def handle_slider_input(self, val):
         scaled_val = val / 100.0
@@ -353,6 +684,16 @@ class MainWindow(QMainWindow):
             pass
 
     def send_target(self, val):
+        self._pending_target = val
+        if not self._target_timer.isActive():
+            self._target_timer.start()
+
+    def _send_pending_target(self):
+        val = self._pending_target
+        if val is None:
+            return
+        self._pending_target = None
+
         # Index 0 is Position, Index 1 is Velocity
         is_pos_mode = (self.mode_select.currentIndex() == 0)
 
@@ -401,13 +742,11 @@ class MainWindow(QMainWindow):
 
             mode = CONTROL_MODE_POSITION_CONTROL if self.mode_select.currentIndex() == 0 else CONTROL_MODE_VELOCITY_CONTROL
 
-            # Pass vlim_val to the worker
-            self.worker.update_tuning(pg_val, vg_val, vig_val, vlim_val, mode)
-
-            time.sleep(0.1)
-            self.worker.set_state(AXIS_STATE_CLOSED_LOOP_CONTROL)
+            # The worker applies the gains and enters closed loop from its
+            # own thread; no GUI-side sleep needed
+            self.worker.request_tuning(pg_val, vg_val, vig_val, vlim_val, mode)
         except ValueError:
-            print("Invalid numerical values")
+            logger.warning("Invalid numerical values")
 
     def handle_toggle_control(self):
         if self.current_axis_state == 8:  # CLOSED_LOOP
@@ -425,14 +764,16 @@ class MainWindow(QMainWindow):
             self.worker.odrv.axis0.motor.config.pre_calibrated = True
             try:
                 self.worker.odrv.save_configuration()
-                print(f"Configuration saved. ODrive is rebooting...")
+                logger.info("Configuration saved. ODrive is rebooting...")
             except:
                 # ODrive reboots after saving, so connection will momentarily drop
                 pass
 
-    @Slot(dict)
+    @Slot(object)
     def update_telemetry(self, data):
-        if "init_config" in data:
+        # Only the connect handshake arrives through the signal; steady-state
+        # samples are pulled from the worker's deque by the render timer
+        if isinstance(data, dict) and "init_config" in data:
             cfg = data["init_config"]
             self.pos_g_input.setText(f"{cfg['pos_gain']:.4f}")
             self.vel_g_input.setText(f"{cfg['vel_gain']:.6f}")
@@ -442,68 +783,124 @@ class MainWindow(QMainWindow):
             # 1 = Pos, 3 = Vel (standard ODrive enums)
             mode_idx = 0 if cfg['mode'] == 1 else 1
             self.mode_select.setCurrentIndex(mode_idx)
-            return  # Don't process the rest of telemetry for this packet
-
 
+    def _ingest(self, data):
+        """Fold one telemetry record into the history ring."""
         self.current_axis_state = data['state']
-
-        # Update Toggle Button Appearance
-        if data['state'] == 8:  # CLOSED_LOOP
-            self.toggle_ctrl_btn.setText("DISABLE CONTROL (IDLE)")
-            self.toggle_ctrl_btn.setStyleSheet(
-                "background-color: #d32f2f; color: white; font-weight: bold; height: 30px;")
-        else:
-            self.toggle_ctrl_btn.setText("ENABLE CLOSED LOOP")
-            self.toggle_ctrl_btn.setStyleSheet(
-                "background-color: #388E3C; color: white; font-weight: bold; height: 30px;")
-
-
-
-        # Update labels
-        states = {0: "UNDEFINED", 1: "IDLE", 8: "CLOSED_LOOP", 7: "ENC_CALIB", 3: "MOTOR_CALIB"}
-        state_text = states.get(data['state'], f"State: {data['state']}")
-        self.label_state.setText(f"State: {state_text}")
-
-
-        ctrl_modes = {1: "VOLTAGE", 2: "TORQUE", 3: "VELOCITY", 4: "POSITION"}
-        self.label_ctrl_mode.setText(f"Ctrl Mode: {ctrl_modes.get(data['ctrl_mode'], data['ctrl_mode'])}")
-        self.label_inp_mode.setText(f"Inp Mode: {data['input_mode']}")
-
-        current_amps = data['iq']
-        bus_voltage = data['vbus']
-        power_watts = bus_voltage * abs(current_amps)  # If using ibus for input power
-
-        self.current_label.setText(f"Motor Current: {current_amps:.2f} A")
-        self.power_label.setText(f"Power: {power_watts:.1f} W")
-
-        self.vbus_label.setText(f"VBus: {data['vbus']:.2f}V")
-        self.label_shadow.setText(f"Shadow: {data['shadow']}")
-        self.label_error.setText(f"Error: {hex(data['error'])}")
-        self.label_live_pos.setText(f"Pos: {data['pos']:.3f} Turns")
-        self.label_live_vel.setText(f"Vel: {data['vel']:.3f} Turns/s")
-
-        # History updates for plots
-        self.iq_data.append(data['iq'])
-        self.vbus_data.append(data['vbus'])
-        self.pos_data.append(data['pos'])
-        self.vel_data.append(data['vel'])
-
-        # Keep list sizes managed
-        if len(self.iq_data) > self.max_points:
-            self.iq_data.pop(0)
-            self.vbus_data.pop(0)
-            self.pos_data.pop(0)
-            self.vel_data.pop(0)
-
-        # Update the curves
-        self.iq_curve.setData(self.iq_data)
-        self.vbus_curve.setData(self.vbus_data)
-        self.pos_curve.setData(self.pos_data)
-        self.vel_curve.setData(self.vel_data)
+        self._latest = data
+
+        # History updates for plots: overwrite the oldest slot in the ring
+        sample = (data['iq'], data['vbus'], data['pos'], data['vel'])
+        self._hist[:, self._head] = sample
+        self._hist[:, self._head + self.max_points] = sample
+        self._head = (self._head + 1) % self.max_points
+        if self._filled < self.max_points:
+            self._filled += 1
+
+        self._dirty = True
+
+    @staticmethod
+    def _set_text(label, text):
+        """setText only when the string changed; Qt recomputes style and
+        invalidates the widget even for identical text."""
+        if label.text() != text:
+            label.setText(text)
+
+    def _hist_window(self):
+        """Newest history samples in chronological order, as a zero-copy
+        (channels, n) slice."""
+        if self._filled < self.max_points:
+            return self._hist[:, :self._filled]
+        return self._hist[:, self._head:self._head + self.max_points]
+
+    def _flush(self):
+        """Render pass driven by the timer: repaints at most once per frame."""
+        try:
+            self._ingest(self.worker.samples.popleft())
+        except IndexError:
+            pass  # No new sample since the last frame
+        if not self._dirty:
+            return
+        self._dirty = False
+        data = self._latest
+
+        # Update Toggle Button Appearance (restyle only on state changes)
+        if data['state'] != self._last_button_state:
+            self._last_button_state = data['state']
+            if data['state'] == 8:  # CLOSED_LOOP
+                self.toggle_ctrl_btn.setText("DISABLE CONTROL (IDLE)")
+                self.toggle_ctrl_btn.setStyleSheet(
+                    "background-color: #d32f2f; color: white; font-weight: bold; height: 30px;")
+            else:
+                self.toggle_ctrl_btn.setText("ENABLE CLOSED LOOP")
+                self.toggle_ctrl_btn.setStyleSheet(
+                    "background-color: #388E3C; color: white; font-weight: bold; height: 30px;")
+
+        # Update labels on every third frame (~10 Hz) — plenty for text —
+        # and bind the helper once: each self.foo is a dict lookup and
+        # this block is the hottest label path
+        self._label_phase = (self._label_phase + 1) % 3
+        if self._label_phase == 0:
+            set_text = self._set_text
+            state = data['state']
+            set_text(self.label_state, _FMT_STATE(AXIS_STATE_NAMES.get(state, state)))
+
+            set_text(self.label_ctrl_mode,
+                     _FMT_CTRL_MODE(CTRL_MODE_NAMES.get(data['ctrl_mode'], data['ctrl_mode'])))
+            set_text(self.label_inp_mode, _FMT_INP_MODE(data['input_mode']))
+
+            current_amps = data['iq']
+            bus_voltage = data['vbus']
+            power_watts = bus_voltage * abs(current_amps)  # If using ibus for input power
+
+            set_text(self.current_label, _FMT_CURRENT(current_amps))
+            set_text(self.power_label, _FMT_POWER(power_watts))
+
+            set_text(self.vbus_label, _FMT_VBUS(bus_voltage))
+            set_text(self.label_shadow, _FMT_SHADOW(data['shadow']))
+            set_text(self.label_error, _FMT_ERROR(data['error']))
+            set_text(self.label_live_pos, _FMT_POS(data['pos']))
+            set_text(self.label_live_vel, _FMT_VEL(data['vel']))
+
+        # Hand each curve its contiguous window slice; connect='all' picks
+        # the fastest branch in arrayToQPath
+        window = self._hist_window()
+        n = window.shape[1]
+        if n:
+            x = self._x_axis[:n]
+            for curve, plot, row in self._curve_table:
+                xs, ys = m4_downsample(x, window[row], int(plot.getViewBox().width()))
+                curve.setData(x=xs, y=ys, skipFiniteCheck=True, connect='all')
+
+        # Re-fit the y axes about once a second from the ring buffer min/max
+        self._y_adapt_count += 1
+        if self._y_adapt_count >= 30 and n:
+            self._y_adapt_count = 0
+            lo = window.min(axis=1)
+            hi = window.max(axis=1)
+            self.iq_plot.setYRange(float(lo[0]), float(hi[0]))
+            self.vbus_plot.setYRange(float(lo[1]), float(hi[1]))
+            self.motion_plot.setYRange(float(min(lo[2], lo[3])),
+                                       float(max(hi[2], hi[3])))
+
+    def closeEvent(self, event):
+        self.worker.stop()
+        # Unbounded: the worker's sleeps are interruptible and its longest
+        # blocking call (find_any, timeout=2) alone outlasted the old 2 s cap.
+        # Returning with the thread alive makes Qt6 abort on destruction.
+        self.worker.wait()
+        super().closeEvent(event)
 
     @Slot(bool, str)
     def update_status(self, connected, message):
-        self.status_label.setText(f"Status: {message}")
+        self._set_text(self.status_label, f"Status: {message}")
+        # No device means no new samples; keep the event loop quiet instead
+        # of waking 30 times a second for nothing
+        if connected and not self._render_timer.isActive():
+            self._render_timer.start(33)
+        elif not connected and self._render_timer.isActive():
+            self._flush()  # Paint whatever is still pending
+            self._render_timer.stop()
         self.apply_tuning_btn.setEnabled(connected)
         self.estop_btn.setEnabled(connected)
         self.clear_btn.setEnabled(connected)